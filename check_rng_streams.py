@@ -0,0 +1,124 @@
+'''
+Course:  Human-Robot Interaction
+Authors: Filip Novicky, Joshua Offergeld, Simon Janssen, Ariyan Tufchi
+Date:    19-01-2023
+
+This script is used to check that the random number streams make the simulations reproducible.
+A few experiments of the precision grid in Simulationscript_Heatmap.ipynb are run in forward and
+in reverse order, and the saved policy posteriors, context posteriors and hand positions are compared.
+The agents select actions stochastically (the notebook uses pymdp's deterministic default), so that
+the check depends on the streams.
+'''
+
+from pymdp.agent import Agent
+from pymdp import utils
+import numpy as np
+import scipy
+
+from model_definition import get_a, get_b, get_e, num_factors, num_modalities
+from rng_streams import ROOT_SEED, HAND_STREAM, CELL_STREAM, get_stream, global_stream
+
+init_switch = 8
+
+
+class SearchEnv(object):
+    """Environment that keeps track of the state and the B matrix"""
+    def __init__(self, D, n, B):
+        self.start = SearchEnv.one_hot(n, np.argmax(D))
+        self.state = self.start
+        self.n = n
+        self.B_obj = B[0]
+        self.B_act = B[1]
+
+    def step(self, action):
+        # take a step given the action selected and store the new state
+        B_choice = self.B_act[:, :, action]
+        self.state = B_choice @ self.state
+
+    @staticmethod
+    def one_hot(n, idx):
+        # return a zero vector of length n with a 1 in position idx
+        vec = np.zeros(n)
+        vec[idx] = 1.0
+        return vec
+
+
+def get_obs(x, time):
+    # object appears at hand position 3/5 from time-step init_switch onwards
+    if time < init_switch:
+        return [1]
+    return [0 if x[3] == 1 or x[5] == 1 else 1]
+
+
+def run_active_inference_loop(my_agent, my_env, T):
+    # run the agent for T time-steps and return the policy posteriors, context posteriors and hand positions
+    obs = [1]
+    saveq_pi, saveaction, savecont = [], [], []
+    for t in range(T):
+        qs = my_agent.infer_states(obs)
+        q_pi, efe = my_agent.infer_policies()
+        chosen_action_id = my_agent.sample_action()
+
+        saveq_pi.append(q_pi)
+        saveaction.append(np.argmax(my_env.state))
+        savecont.append(qs[0])
+
+        my_env.step(int(chosen_action_id[1]))
+        obs = get_obs(my_env.state, t + 1)
+    return saveq_pi, saveaction, savecont
+
+
+def run_grid(cells, A, B, E, hand, T):
+    # run the experiment of every (n, ze, rh) cell in the given order and return the results per cell
+    results = {}
+    for n, ze, zeta, rh, rho in cells:
+        A_use = utils.obj_array(num_modalities)
+        A_use[0] = np.copy(A[0])
+        B_use = utils.obj_array(num_factors)
+        B_use[0] = np.copy(B[0])
+        B_use[1] = np.copy(B[1])
+
+        for i in range(1, 4):
+            A_use[0][:, i, :] = scipy.special.softmax(zeta * np.log(A[0][:, i, :] + np.exp(-8)), axis=0)
+        B_use[0][:, :, 0] = scipy.special.softmax(0.8 * np.log(np.eye(4) + np.exp(-8)), axis=0)
+        E_use = scipy.special.softmax(rho * np.log(E + np.exp(-8)), axis=0)
+
+        D = utils.obj_array(num_factors)
+        D[0] = np.array([1, 0, 0, 0])
+        D[1] = SearchEnv.one_hot(8, hand)
+
+        env = SearchEnv(D[1], 8, B_use)
+        my_agent = Agent(A=A_use, B=B_use, C=None, D=D, E=E_use, use_utility=True, use_states_info_gain=True,
+                         action_selection="stochastic", alpha=1.0)
+        with global_stream(ROOT_SEED, CELL_STREAM, n, ze, 0, rh):
+            results[(n, ze, rh)] = run_active_inference_loop(my_agent, env, T)
+
+        # disturb the global state between cells, which must not influence the next cell
+        np.random.random()
+    return results
+
+
+if __name__ == '__main__':
+    """ Main entry point
+
+    """
+    A = get_a()
+    B = get_b()
+    E = get_e()
+    hand = get_stream(ROOT_SEED, HAND_STREAM).integers(0, 8)
+
+    ZETA = [0.01, 0.3]
+    RHO = [0.1, 1, 10]
+    N = 2
+    T = 40
+
+    cells = [(n, ze, zeta, rh, rho) for n in range(N) for ze, zeta in enumerate(ZETA) for rh, rho in enumerate(RHO)]
+    forward = run_grid(cells, A, B, E, hand, T)
+    backward = run_grid(cells[::-1], A, B, E, hand, T)
+
+    for key, (q_pi, action, cont) in forward.items():
+        q_pi_b, action_b, cont_b = backward[key]
+        assert np.array_equal(np.array(q_pi), np.array(q_pi_b)), "Policy posterior differs for cell {}".format(key)
+        assert np.array_equal(np.array(cont), np.array(cont_b)), "Context posterior differs for cell {}".format(key)
+        assert np.array_equal(np.array(action), np.array(action_b)), "Hand position differs for cell {}".format(key)
+    print("Results of {} cells are identical in forward and reverse order".format(len(cells)))
@@ -0,0 +1,57 @@
+'''
+Course:  Human-Robot Interaction
+Authors: Filip Novicky, Joshua Offergeld, Simon Janssen, Ariyan Tufchi
+Date:    19-01-2023
+
+This script is used to derive reproducible random number streams from a single root seed.
+Every stream is identified by a key (e.g. the repeat and the precision indices of a grid cell),
+so the numbers drawn in a cell do not depend on the order in which the cells are executed.
+This makes serial, batched and multi-process runs of the simulation give identical results.
+Note that global_stream swaps the process-global numpy state, so it is safe for multiple processes but not for threads.
+'''
+
+from contextlib import contextmanager
+
+import numpy as np
+
+ROOT_SEED = 2023       # default root seed for the simulations
+
+# Stream kinds, used as the first element of a stream key
+HAND_STREAM = 0        # initial hand position
+CELL_STREAM = 1        # one simulation run in the precision grid
+TOUCH_STREAM = 2       # simulated touches
+
+
+def _seed_sequence(root_seed, key):
+    # the key is used as the spawn key, so every key gives an independent child of the root seed
+    return np.random.SeedSequence(root_seed, spawn_key=tuple(int(k) for k in key))
+
+
+def get_stream(root_seed, *key):
+    # return a counter-based (Philox) generator for the stream identified by key
+    return np.random.Generator(np.random.Philox(_seed_sequence(root_seed, key)))
+
+
+def get_seed(root_seed, *key):
+    # return an integer seed for the stream identified by key, for use with the random module
+    return int(_seed_sequence(root_seed, key).generate_state(1, dtype=np.uint64)[0])
+
+
+@contextmanager
+def global_stream(root_seed, *key):
+    """ Temporarily seed the global numpy state from the stream identified by key
+
+    pymdp samples actions from the global numpy state, so an agent run inside this block
+    is reproducible. The previous global state is restored afterwards.
+    np.random.set_state only accepts legacy MT19937 state, so this stream is an MT19937
+    stream seeded from the key, not a Philox stream as returned by get_stream.
+    The global state is shared by all threads of a process, so do not use this from
+    several threads at once (e.g. a thread pool); use separate processes instead.
+    """
+    saved_state = np.random.get_state()
+    stream_state = np.random.RandomState(np.random.MT19937(_seed_sequence(root_seed, key)))
+    np.random.set_state(stream_state.get_state())
+    try:
+        yield
+    finally:
+        np.random.set_state(saved_state)
@@ -18,6 +18,7 @@ import random
 
 HOST = 'localhost'     # set host for connection with python3 script
 CONNPORT = 8081        # set connection port for connection with python3 script
+SEED = 1110817498133647613  # seed for random touches, computed as rng_streams.get_seed(ROOT_SEED, TOUCH_STREAM) (copied, as this script runs on python2)
 
 class Touch():
     def __init__(self):
@@ -47,7 +48,7 @@ def main():
     timesteps = 80                     # Decide how long to run the experiment
     
     actThread = Act(touchData, timesteps)         # Create thread for acting in environment
-    senseThread = Sense(touchData)                # Create thread for sensing in environment
+    senseThread = Sense(touchData, SEED)          # Create thread for sensing in environment
 
     # This is the experimental data for the experiments in which a state was not always touched
     experimentTouchData = [[12, 14, 20, 22, 24, 26, 38],                                                              # Experiment 1
@@ -142,13 +143,16 @@ class Sense(Thread):
         - Update shared variable when touched
         - Check whether act thread finished and stop thread accordingly
     '''
-    def __init__(self, touchInstance):
+    def __init__(self, touchInstance, seed=SEED):
         # call the parent constructor
         super(Sense, self).__init__()
 
         # Initiate shared class to store touch data
         self.touchData = touchInstance
 
+        # Initiate own random generator for the touch stream
+        self.random = random.Random(seed)
+
         self.i = 0
         self.s = 0
         self.timestep = 1
@@ -192,10 +196,16 @@ class Sense(Thread):
                 break
 
     def simulateRandomTouch(self, prob):
-        touchVal = random.random()
-        # Touch value is updated with probability prob
-        if touchVal < prob:
-            self.touchData.readAndReset(0.0)
+        state = self.touchData.getState()
+        # Only draw once per time-step (as in simulateTouchList), so the draws do not depend on how often the thread polls
+        if state != self.s:
+            touchVal = self.random.random()
+            # Touch value is updated with probability prob
+            if touchVal < prob:
+                self.touchData.readAndReset(0.0)
+            # Update the time-step
+            self.timestep += 1
+            self.s = state
 
     def simulateStateTouch(self):
         state = self.touchData.getState()